@@ -1,9 +1,11 @@
 import os
 import json
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
+# Load environment variables (skip parsing .env when credentials are already exported)
+if not (os.environ.get("BS_USERNAME") and os.environ.get("BS_PASSWORD")):
+    load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
 
 # Credentials (store in .env file)
 USERNAME = os.getenv("BS_USERNAME", "")
@@ -22,8 +24,9 @@ LOG_FILE = os.path.join(LOGS_DIR, "bs_to_backup.log")
 CONFIG_DIR = os.path.dirname(__file__)
 SELECTORS_CONFIG_FILE = os.path.join(CONFIG_DIR, "selectors_config.json")
 
+@lru_cache(maxsize=None)
 def load_selectors_config():
-    """Load site-specific selectors configuration from JSON"""
+    """Load site-specific selectors configuration from JSON (parsed once per process)"""
     try:
         with open(SELECTORS_CONFIG_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -31,7 +34,12 @@ def load_selectors_config():
         print(f"⚠ Warning: Could not load selectors config: {str(e)}")
         return {}
 
-SELECTORS_CONFIG = load_selectors_config()
+def __getattr__(name):
+    # SELECTORS_CONFIG is resolved lazily so importing config for paths/credentials
+    # (e.g. report-only runs) does not read and parse the selectors JSON.
+    if name == "SELECTORS_CONFIG":
+        return load_selectors_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Scraping configuration
 HEADLESS = True  # Set to False to see browser automation
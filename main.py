@@ -7,36 +7,64 @@ Supports sequential/parallel scraping, checkpoint resume, batch URL import,
 and interactive change confirmation before saving.
 """
 
+import argparse
+import atexit
+import heapq
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import re
-import subprocess
 import sys
-from urllib.parse import urlparse
+import tempfile
+import time
 
 # Ensure project root is on sys.path so imports work from any working directory
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from config.config import USERNAME, PASSWORD, DATA_DIR, LOG_FILE
-from src.scraper import BsToScraper
+from config.config import USERNAME, PASSWORD, DATA_DIR, LOG_FILE, SERIES_INDEX_FILE
 from src.index_manager import IndexManager, confirm_and_save_changes, show_vanished_series
-
-# Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=10*1024*1024, backupCount=5),
-        logging.StreamHandler()
-    ]
-)
+from src.prompts import ask, is_preset
+
+# Logging — the log file is written by a background QueueListener so scraper
+# threads only enqueue records instead of waiting on disk I/O. The console
+# handler stays synchronous to keep log lines in order with print() output.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=10*1024*1024, backupCount=5)
+_file_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # listener's handler adds the prefix
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_log_formatter)
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler, _console_handler])
 # Suppress urllib3 retry noise — these flood the console when geckodriver is killed externally
 logging.getLogger('urllib3').setLevel(logging.ERROR)
 logger = logging.getLogger(__name__)
 
-_SERIE_URL_RE = re.compile(r'/serie/[^/]+')
+# A bs.to series page (any subdomain); groups: scheme, host, /serie/<name>
+_SERIES_URL_RE = re.compile(r'^(https?)://((?:[\w-]+\.)*bs\.to)(/serie/[^/?#]+)', re.IGNORECASE)
+# One URL per line in batch files; scanned over the raw bytes in a single pass
+_URL_LINE_RE = re.compile(rb'^\s*(https?://\S+)\s*$', re.MULTILINE)
+
+# Runtime file paths (resolved once at import)
+CHECKPOINT_FILE = os.path.join(DATA_DIR, '.scrape_checkpoint.json')
+# Checkpoints older than this (seconds) are flagged as stale before resuming
+CHECKPOINT_MAX_AGE = 24 * 3600
+PAUSE_FILE = os.path.join(DATA_DIR, '.pause_scraping')
+REPORT_FILE = os.path.join(DATA_DIR, 'series_report.json')
+REPORT_INDENT = int(os.getenv('BS_REPORT_INDENT', '0'))
+SERIES_URLS_FILE = os.path.join(os.path.dirname(__file__), 'series_urls.txt')
+
+# Parsed worker PID files keyed by path: (st_mtime_ns, data)
+_PID_FILE_CACHE = {}
+
+# Loaded index shared by menu actions: (st_mtime_ns of SERIES_INDEX_FILE, IndexManager)
+_index_cache = None
 
 _MODE_LABELS = {
     'all_series': 'Scrape all series',
@@ -53,33 +81,44 @@ def print_header():
     print("="*60 + "\n")
 
 
+def _get_index():
+    """Return the loaded IndexManager, re-reading the index only when the file changed on disk."""
+    global _index_cache
+    try:
+        mtime = os.stat(SERIES_INDEX_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _index_cache is None or _index_cache[0] != mtime:
+        _index_cache = (mtime, IndexManager())
+    return _index_cache[1]
+
+
+def _invalidate_index():
+    """Force the next _get_index() to reload (e.g. after saving changes)."""
+    global _index_cache
+    _index_cache = None
+
+
 def print_scraped_series_status():
     """Print episode counts for the most recently updated series."""
     try:
-        index_manager = IndexManager()
+        index_manager = _get_index()
         
         if not index_manager.series_index:
             return
         
-        # Show top updated/new series with their complete episode counts
-        series_list = list(index_manager.series_index.values())
-        if not series_list:
-            return
-        
-        # Sort by last updated (most recent first)
-        sorted_series = sorted(
-            series_list,
+        # Show the 5 most recently updated series — a bounded heap, no full sort
+        recent = heapq.nlargest(
+            5,
+            index_manager.series_index.values(),
             key=lambda s: s.get('last_updated', s.get('added_date', '')),
-            reverse=True
         )
         
-        # Show first 5 updated series
-        display_count = min(5, len(sorted_series))
-        if display_count > 0:
+        if recent:
             print("\n" + "-"*70)
             print("EPISODE STATUS (from merged index):")
             print("-"*70)
-            for s in sorted_series[:display_count]:
+            for s in recent:
                 watched = s.get('watched_episodes', 0)
                 total = s.get('total_episodes', 0)
                 percent = round((watched / total * 100), 1) if total else 0
@@ -114,30 +153,48 @@ def show_menu():
     print("  9. Exit\n")
 
 
+def _format_age(hours):
+    """Short human-readable age, e.g. '45m', '3.5h', '2d'."""
+    if hours < 1:
+        return f"{int(hours * 60)}m"
+    if hours < 48:
+        return f"{hours:.1f}h"
+    return f"{int(hours // 24)}d"
+
+
 def _check_checkpoint(expected_mode):
     """Check for an existing checkpoint and prompt the user to resume or discard.
 
     Returns dict with 'ok' (proceed?) and 'resume' (resume from checkpoint?).
     """
+    from src.scraper import BsToScraper
+
     saved_mode = BsToScraper.get_checkpoint_mode(DATA_DIR)
     if saved_mode is None:
         return {'ok': True, 'resume': False}
 
     saved_label = _MODE_LABELS.get(saved_mode, saved_mode)
     expected_label = _MODE_LABELS.get(expected_mode, expected_mode)
-
-    checkpoint_file = os.path.join(DATA_DIR, '.scrape_checkpoint.json')
+    try:
+        age_hours = (time.time() - os.path.getmtime(CHECKPOINT_FILE)) / 3600
+    except OSError:
+        age_hours = 0.0
 
     if saved_mode == expected_mode:
-        print(f"\n⚠ Checkpoint found from a previous \"{saved_label}\" run!\n")
-        choice = input("Resume from checkpoint? (y/n): ").strip().lower()
+        print(f"\n⚠ Checkpoint found from a previous \"{saved_label}\" run ({_format_age(age_hours)} ago)!\n")
+        if age_hours * 3600 > CHECKPOINT_MAX_AGE:
+            # Watch status keeps changing on the site — old scraped data would overwrite newer state
+            print("  ⚠ This checkpoint is stale; its scraped data may no longer match your watch status.")
+            choice = ask("Resume anyway? (y/n): ", 'BS_RESUME').strip().lower()
+        else:
+            choice = ask("Resume from checkpoint? (y/n): ", 'BS_RESUME').strip().lower()
         if choice == 'y':
             return {'ok': True, 'resume': True}
         # User declined resume — ask whether to discard
-        discard = input("Discard old checkpoint and start fresh? (y/n): ").strip().lower()
+        discard = ask("Discard old checkpoint and start fresh? (y/n): ", 'BS_DISCARD_CHECKPOINT').strip().lower()
         if discard == 'y':
             try:
-                os.remove(checkpoint_file)
+                os.remove(CHECKPOINT_FILE)
             except OSError:
                 pass
             return {'ok': True, 'resume': False}
@@ -145,21 +202,43 @@ def _check_checkpoint(expected_mode):
     else:
         print(f"\n⚠ A checkpoint exists from a different mode: \"{saved_label}\"")
         print(f"   You are about to run: \"{expected_label}\"\n")
-        discard = input("Discard the old checkpoint and continue? (y/n): ").strip().lower()
+        discard = ask("Discard the old checkpoint and continue? (y/n): ", 'BS_DISCARD_CHECKPOINT').strip().lower()
         if discard == 'y':
             try:
-                os.remove(checkpoint_file)
+                os.remove(CHECKPOINT_FILE)
             except OSError:
                 pass
             return {'ok': True, 'resume': False}
         return {'ok': False, 'resume': False}
 
 
-def _run_scrape_and_save(run_kwargs, description, success_msg, no_data_msg):
-    """Create scraper, run, confirm & save. Returns the scraper or None on error."""
+# One scraper per process: its browser stays open between menu actions
+_session_scraper = None
+
+
+def _get_scraper():
+    """Return the shared scraper, creating it on first use."""
+    global _session_scraper
+    if _session_scraper is None:
+        # Selenium is only needed by scraping actions — import it on first use
+        from src.scraper import BsToScraper
+        _session_scraper = BsToScraper()
+    return _session_scraper
+
+
+def _close_session_scraper():
+    """Close the shared scraper's browser, if one was opened."""
+    if _session_scraper is not None:
+        _session_scraper.clear_worker_pids()
+        _session_scraper.close()
+
+
+def _run_scrape_and_save(run_kwargs, description, success_msg, no_data_msg, scraper=None):
+    """Run scraper (shared one if not given), confirm & save. Returns the scraper or None on error."""
     try:
-        scraper = BsToScraper()
-        scraper.run(**run_kwargs)
+        if scraper is None:
+            scraper = _get_scraper()
+        scraper.run(keep_browser=True, **run_kwargs)
 
         if scraper.series_data:
             # Show vanished-series notification if full catalogue was fetched
@@ -170,10 +249,11 @@ def _run_scrape_and_save(run_kwargs, description, success_msg, no_data_msg):
                     if slug and slug != 'unknown':
                         all_slugs.add(slug)
                 scope = 'new_only' if run_kwargs.get('new_only') else 'all'
-                index_manager = IndexManager()
+                index_manager = _get_index()
                 show_vanished_series(index_manager.series_index, all_slugs, scope)
 
             if confirm_and_save_changes(scraper.series_data, description):
+                _invalidate_index()
                 print(f"\n✓ {success_msg}")
                 print_scraped_series_status()
                 logger.info(success_msg)
@@ -193,6 +273,7 @@ def _run_scrape_and_save(run_kwargs, description, success_msg, no_data_msg):
         print(f"\n⚠ Scraping interrupted by Ctrl+C")
         if 'scraper' in locals() and scraper.series_data:
             if confirm_and_save_changes(scraper.series_data, description):
+                _invalidate_index()
                 print(f"\n✓ Partial data saved ({len(scraper.series_data)} series)")
                 logger.info(f"{description} interrupted — partial data saved")
         if 'scraper' in locals() and scraper.failed_links:
@@ -223,7 +304,7 @@ def scrape_series():
     print("  1. Sequential (slower, but most reliable)")
     print("  2. Parallel (faster, uses multiple workers)")
     print("  0. Back\n")
-    mode_choice = input("Choose mode (0-2) [default: 2]: ").strip() or '2'
+    mode_choice = ask("Choose mode (0-2) [default: 2]: ", 'BS_SCRAPE_MODE').strip() or '2'
 
     if mode_choice == '0':
         return
@@ -258,32 +339,34 @@ def scrape_new_series():
     )
 
 
+def _normalize_series_url(url):
+    """Canonical series URL (lower-case scheme/host, /serie/<name> only), or None if not a series page."""
+    m = _SERIES_URL_RE.match(url)
+    if not m:
+        return None
+    scheme, host, path = m.groups()
+    return f"{scheme.lower()}://{host.lower()}{path}"
+
+
 def add_series_by_url():
     print("\n→ Add single series by URL")
     print("  Example: https://bs.to/serie/Breaking-Bad")
     print("  0. Back\n")
     
     while True:
-        url = input("Enter series URL: ").strip()
+        url = ask("Enter series URL: ", 'BS_SERIES_URL').strip()
         # Validate URL format
         if not url or url == '0':
             return
-        if not url.startswith(("http://", "https://")):
-            print("✗ Invalid URL (must start with http:// or https://)")
-            continue
-        try:
-            parsed_url = urlparse(url)
-            if not parsed_url.netloc or 'bs.to' not in parsed_url.netloc:
-                print("✗ Invalid bs.to URL")
-                continue
-            # Require /serie/ in path
-            if not _SERIE_URL_RE.search(parsed_url.path):
-                print("✗ URL must be a valid bs.to series page (e.g. https://bs.to/serie/Breaking-Bad)")
-                continue
-        except Exception as e:
-            print("✗ Invalid URL format")
-            logger.error(f"Invalid URL format: {url}, error: {e}")
+        series_url = _normalize_series_url(url)
+        if not series_url:
+            print("✗ URL must be a valid bs.to series page (e.g. https://bs.to/serie/Breaking-Bad)")
+            if is_preset('BS_SERIES_URL'):
+                # A preset answer never changes — re-prompting would loop forever
+                logger.error(f"BS_SERIES_URL is not a bs.to series URL: {url}")
+                return
             continue
+        url = series_url
         break
     
     print("\n→ Starting scraper for single series...")
@@ -319,11 +402,11 @@ def _print_single_series_status(series_data, url):
         return
 
     # Prefer merged index data over raw scraped data
-    index_manager = IndexManager()
-    source = next(
-        (s for s in index_manager.series_index.values()
-         if s.get('title') == series.get('title') or s.get('link') == series.get('link')),
-        series,
+    index_manager = _get_index()
+    source = (
+        index_manager.series_index.get(series.get('title'))
+        or index_manager.get_by_link(series.get('link'))
+        or series
     )
 
     watched = source.get('watched_episodes', 0)
@@ -332,16 +415,53 @@ def _print_single_series_status(series_data, url):
     print(f"\nStatus for '{source.get('title', url)}': {watched}/{total} episodes watched ({percent}%)")
 
 
+def _atomic_write_text(filepath, text):
+    """Write text via temp file + os.replace so readers never see a half-written file."""
+    dirpath = os.path.dirname(filepath)
+    os.makedirs(dirpath, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, filepath)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_fresh_report():
+    """Return the saved report if it is newer than the index, else None."""
+    try:
+        if os.stat(REPORT_FILE).st_mtime_ns < os.stat(SERIES_INDEX_FILE).st_mtime_ns:
+            return None
+        with open(REPORT_FILE, 'rb') as f:
+            report = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(report, dict) or 'metadata' not in report or 'categories' not in report:
+        return None
+    return report
+
+
 def generate_report():
-    manager = IndexManager()
-    report = manager.get_full_report()
-    
-    report_file = os.path.join(DATA_DIR, 'series_report.json')
-    
+    # The index is only parsed when the report must be rebuilt or URLs are exported
     try:
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        print(f"\n✓ Report saved to: {report_file}")
+        report = _load_fresh_report()
+        if report is not None:
+            print(f"\n✓ Index unchanged since last report — showing: {REPORT_FILE}")
+        else:
+            report = _get_index().get_full_report()
+            # Encode in one go and write once — json.dump() streams hundreds of tiny writes.
+            # Compact by default; set BS_REPORT_INDENT (e.g. 2) for a human-readable file.
+            if REPORT_INDENT:
+                payload = json.dumps(report, indent=REPORT_INDENT, ensure_ascii=False)
+            else:
+                payload = json.dumps(report, ensure_ascii=False, separators=(',', ':'))
+            _atomic_write_text(REPORT_FILE, payload)
+            print(f"\n✓ Report saved to: {REPORT_FILE}")
         
         # Display summary
         meta = report['metadata']
@@ -359,35 +479,28 @@ def generate_report():
         if ongoing_count > 0:
             print(f"\n📺 ONGOING SERIES ({ongoing_count}):")
             ongoing_titles = report['categories']['ongoing']['titles']
-            for title in ongoing_titles[:10]:
-                print(f"  • {title}")
+            print("\n".join(f"  • {title}" for title in ongoing_titles[:10]))
             if ongoing_count > 10:
                 print(f"  ... and {ongoing_count - 10} more\n")
             
             # Offer to export ongoing series URLs to series_urls.txt
-            export = input(f"\nExport {ongoing_count} ongoing series URLs to series_urls.txt? (y/n): ").strip().lower()
+            export = ask(f"\nExport {ongoing_count} ongoing series URLs to series_urls.txt? (y/n): ", 'BS_EXPORT_URLS').strip().lower()
             if export == 'y':
                 try:
-                    # Get URLs for ongoing series
-                    urls = []
+                    # Stream one line per ongoing series with a known URL
+                    title_to_url = _get_index().title_to_url
                     ongoing_titles = report['categories']['ongoing']['titles']
-                    for title in ongoing_titles:
-                        series_data = manager.series_index.get(title, {})
-                        url = series_data.get('url') or series_data.get('link')
-                        if url:
-                            # Full URL if needed
-                            if not url.startswith('http'):
-                                url = f"https://bs.to{url}"
-                            urls.append(url)
+                    exported = sum(1 for title in ongoing_titles if title in title_to_url)
                     
-                    if urls:
-                        # Write to series_urls.txt
-                        urls_file = os.path.join(os.path.dirname(__file__), 'series_urls.txt')
-                        with open(urls_file, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(urls) + '\n')
-                        print(f"\n✓ Exported {len(urls)} URLs to series_urls.txt")
-                        print(f"  → Use option 6 (Batch add) to rescrape these series")
-                        logger.info(f"Exported {len(urls)} URLs to series_urls.txt")
+                    if exported:
+                        with open(SERIES_URLS_FILE, 'w', encoding='utf-8') as f:
+                            f.writelines(
+                                title_to_url[title] + '\n'
+                                for title in ongoing_titles if title in title_to_url
+                            )
+                        print(f"\n✓ Exported {exported} URLs to series_urls.txt")
+                        print(f"  → Use option 5 (Batch add) to rescrape these series")
+                        logger.info(f"Exported {exported} URLs to series_urls.txt")
                     else:
                         print("\n⚠ Could not extract URLs from ongoing series")
                         logger.warning("Could not extract URLs from ongoing series for export")
@@ -407,12 +520,11 @@ def batch_add_series_from_file():
     print("    https://bs.to/serie/Breaking-Bad")
     print("  (type 0 to go back)")
     
-    default_file = os.path.join(os.path.dirname(__file__), 'series_urls.txt')
-    file_path = input(f"Enter file path [default: series_urls.txt]: ").strip().strip("\"'")    
+    file_path = ask("Enter file path [default: series_urls.txt]: ", 'BS_BATCH_FILE').strip().strip("\"'")
     if file_path == '0':
         return
     if not file_path:
-        file_path = default_file
+        file_path = SERIES_URLS_FILE
     
     if not os.path.exists(file_path):
         print(f"✗ File not found: {file_path}")
@@ -420,23 +532,40 @@ def batch_add_series_from_file():
     
     # Read URLs from file
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip() and line.strip().startswith('http')]
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        raw_urls = [m.group(1).decode('utf-8') for m in _URL_LINE_RE.finditer(data)]
     except Exception as e:
         print(f"✗ Failed to read file: {str(e)}")
         logger.error(f"Failed to read file {file_path}: {e}")
         return
     
-    if not urls:
+    if not raw_urls:
         print("✗ No valid URLs found in file")
         return
     
+    # Drop non-series links, then collapse season links, trailing slashes and case
+    # variants so each series is scraped once
+    series_urls = [u for u in map(_normalize_series_url, raw_urls) if u]
+    unique = {}
+    for url in series_urls:
+        unique.setdefault(url.lower(), url)
+    urls = list(unique.values())
+    
+    if not urls:
+        print("✗ No bs.to series URLs found in file")
+        return
+    
     print(f"\n✓ Found {len(urls)} URL(s) in file")
+    if len(series_urls) < len(raw_urls):
+        print(f"  ⚠ Skipped {len(raw_urls) - len(series_urls)} non-series URL(s)")
+    if len(urls) < len(series_urls):
+        print(f"  ⚠ Skipped {len(series_urls) - len(urls)} duplicate URL(s)")
     print("\nURLs to process:")
     for url in urls:
         print(f"  • {url}")
     
-    confirm = input("\nProceed with batch add? (y/n): ").strip().lower()
+    confirm = ask("\nProceed with batch add? (y/n): ", 'BS_BATCH_CONFIRM').strip().lower()
     if confirm != 'y':
         print("✗ Cancelled")
         return
@@ -460,8 +589,8 @@ def retry_failed_series():
     print("\n→ Retry failed series from last run")
     print("  (Browser will open - do not close it manually)\n")
 
-    temp_scraper = BsToScraper()
-    failed_list = temp_scraper.load_failed_series()
+    scraper = _get_scraper()
+    failed_list = scraper.load_failed_series()
     if not failed_list:
         print("✓ No failed series found. Nothing to retry.")
         return
@@ -478,29 +607,58 @@ def retry_failed_series():
         description="Retry data",
         success_msg="Retry completed successfully!",
         no_data_msg="No data to retry",
+        scraper=scraper,
     )
 
 
 def pause_scraping():
-    pause_file = os.path.join(DATA_DIR, '.pause_scraping')
     try:
-        with open(pause_file, 'w', encoding='utf-8') as f:
-            f.write('PAUSE')
-        print(f"\n✓ Pause file created: {pause_file}\nWorkers will pause at next checkpoint.")
-        logger.info(f"Pause file created: {pause_file}")
+        # Atomic so a scraper polling for the flag never sees a half-written file
+        _atomic_write_text(PAUSE_FILE, 'PAUSE')
+        print(f"\n✓ Pause file created: {PAUSE_FILE}\nWorkers will pause at next checkpoint.")
+        logger.info(f"Pause file created: {PAUSE_FILE}")
     except Exception as e:
         print(f"\n✗ Failed to create pause file: {str(e)}")
-        logger.error(f"Failed to create pause file {pause_file}: {e}")
+        logger.error(f"Failed to create pause file {PAUSE_FILE}: {e}")
+
+
+def _read_pid_file(fpath):
+    """Return parsed PID file contents, reparsing only when its mtime changed.
+
+    Retries once on a JSON error in case the file was caught mid-update by a
+    writer that does not replace it atomically.
+    """
+    for attempt in range(2):
+        mtime = os.stat(fpath).st_mtime_ns
+        cached = _PID_FILE_CACHE.get(fpath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(fpath, 'rb') as f:
+                data = json.loads(f.read())
+        except json.JSONDecodeError:
+            if attempt:
+                raise
+            time.sleep(0.1)
+            continue
+        _PID_FILE_CACHE[fpath] = (mtime, data)
+        return data
+
 
 def show_active_workers():
     try:
-        pid_files = [
-            os.path.join(DATA_DIR, f) for f in os.listdir(DATA_DIR)
-            if f.startswith('.worker_pids_') and f.endswith('.json')
-        ]
+        with os.scandir(DATA_DIR) as entries:
+            pid_files = [
+                entry.path for entry in entries
+                if entry.name.startswith('.worker_pids_') and entry.name.endswith('.json')
+            ]
     except OSError:
         pid_files = []
 
+    # Forget cached entries for PID files that have since been removed
+    for stale in _PID_FILE_CACHE.keys() - set(pid_files):
+        del _PID_FILE_CACHE[stale]
+
     if not pid_files:
         print("\n✓ No active workers found\n")
         return
@@ -510,8 +668,7 @@ def show_active_workers():
     live_files = []
     for fpath in pid_files:
         try:
-            with open(fpath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_pid_file(fpath)
             if not isinstance(data, dict):
                 continue
             owner_pid = data.get('_owner_pid', '?')
@@ -528,35 +685,34 @@ def show_active_workers():
         print("\n✓ No active workers found\n")
         return
 
-    print(f"\n📊 ACTIVE WORKERS ({len(all_workers)} across {len(live_files)} instance(s)):")
-    print("Instance PID | Worker ID | Worker PID | Type")
-    print("-------------|-----------|------------|-----")
+    # Render the whole table first and emit it with one write
+    lines = [
+        f"\n📊 ACTIVE WORKERS ({len(all_workers)} across {len(live_files)} instance(s)):",
+        "Instance PID | Worker ID | Worker PID | Type",
+        "-------------|-----------|------------|-----",
+    ]
     try:
         for (owner_pid, worker_id), (pid, _) in sorted(
             all_workers.items(), key=lambda x: (x[0][0], int(x[0][1]))
         ):
             worker_type = "Main" if worker_id == "0" else "Worker"
-            print(f"{owner_pid:>12} | {worker_id:>9} | {pid:>10} | {worker_type}")
+            lines.append(f"{owner_pid:>12} | {worker_id:>9} | {pid:>10} | {worker_type}")
     except Exception as e:
         print("✗ Error parsing worker PIDs. File may be corrupted.")
         logger.error(f"Error parsing worker PIDs: {e}")
         return
-    print()
-    kill_choice = input("Kill all workers? (y/n): ").strip().lower()
+    lines.append("")
+    print("\n".join(lines))
+    kill_choice = ask("Kill all workers? (y/n): ", 'BS_KILL_WORKERS').strip().lower()
     if kill_choice == 'y':
         print("\n🔴 Killing all workers...")
+        pids = [pid for pid, _ in all_workers.values()]
         killed_count = 0
-        for (owner_pid, worker_id), (pid, _) in all_workers.items():
-            try:
-                if sys.platform == 'win32':
-                    subprocess.run(['taskkill', '/F', '/PID', str(pid), '/T'],
-                                   capture_output=True, check=False)
-                else:
-                    subprocess.run(['kill', '-9', str(pid)],
-                                   capture_output=True, check=False)
-                killed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to kill worker {worker_id} (PID {pid}): {e}")
+        try:
+            from src.scraper import kill_pids
+            killed_count = kill_pids(pids)
+        except Exception as e:
+            logger.error(f"Failed to kill workers (PIDs {pids}): {e}")
         # Remove all tracked PID files
         removed_files = 0
         for fpath in set(fp for _, (_, fp) in all_workers.items()):
@@ -565,44 +721,80 @@ def show_active_workers():
                 removed_files += 1
             except Exception as e:
                 logger.error(f"Failed to clean up {fpath}: {e}")
+        if killed_count < len(pids):
+            print(f"⚠ {len(pids) - killed_count} worker(s) were already gone or could not be killed")
         print(f"✓ Killed {killed_count} worker(s) and cleaned up {removed_files} tracking file(s)\n")
         logger.info(f"Killed {killed_count} workers and cleaned up {removed_files} tracking files")
     else:
         print("✓ Workers left running\n")
 
 
-def main():
+# Menu number -> handler (option 9 exits the loop)
+_MENU_ACTIONS = {
+    '1': scrape_series,
+    '2': scrape_new_series,
+    '3': add_series_by_url,
+    '4': generate_report,
+    '5': batch_add_series_from_file,
+    '6': retry_failed_series,
+    '7': pause_scraping,
+    '8': show_active_workers,
+}
+
+# CLI subcommand -> (handler, help text)
+_COMMANDS = {
+    'scrape': (scrape_series, "Scrape all series from bs.to"),
+    'scrape-new': (scrape_new_series, "Scrape only NEW series"),
+    'add-url': (add_series_by_url, "Add single series by URL"),
+    'report': (generate_report, "Generate full report"),
+    'batch': (batch_add_series_from_file, "Batch add series from text file"),
+    'retry': (retry_failed_series, "Retry failed series from last run"),
+    'pause': (pause_scraping, "Pause current scraping"),
+    'workers': (show_active_workers, "Show active workers"),
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="BS.TO series scraper & index manager. Run without a command for the interactive menu."
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    for name, (_, help_text) in _COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     print_header()
     if not validate_credentials():
         sys.exit(1)
         
     print(f"✓ Credentials found for user: {USERNAME}\n")
-    
-    while True:
-        show_menu()
-        choice = input("Enter your choice (1-9): ").strip()
-        if not choice.isdigit() or not (1 <= int(choice) <= 9):
-            print("✗ Invalid choice. Please enter a number between 1 and 9.")
-            continue
-        if choice == '1':
-            scrape_series()
-        elif choice == '2':
-            scrape_new_series()
-        elif choice == '3':
-            add_series_by_url()
-        elif choice == '4':
-            generate_report()
-        elif choice == '5':
-            batch_add_series_from_file()
-        elif choice == '6':
-            retry_failed_series()
-        elif choice == '7':
-            pause_scraping()
-        elif choice == '8':
-            show_active_workers()
-        elif choice == '9':
-            print("\n✓ Goodbye!\n")
-            break
+
+    try:
+        # Single-shot mode: run one action and exit (scripts, cron, CI)
+        if args.command is not None:
+            handler, _ = _COMMANDS[args.command]
+            handler()
+            return
+
+        while True:
+            show_menu()
+            choice = input("Enter your choice (1-9): ").strip()
+            if not choice.isdigit() or not (1 <= int(choice) <= 9):
+                print("✗ Invalid choice. Please enter a number between 1 and 9.")
+                continue
+            if choice == '9':
+                print("\n✓ Goodbye!\n")
+                break
+            _MENU_ACTIONS[choice]()
+    except KeyboardInterrupt:
+        # src.scraper turns Ctrl+C into a clean exit once imported; match that before it is
+        print("\n✓ Goodbye!\n")
+    finally:
+        _close_session_scraper()
 
 
 if __name__ == "__main__":
@@ -1,16 +1,29 @@
+import heapq
 import json
 import logging
 import os
 import re
 import shutil
+import sys
 import tempfile
 from collections import defaultdict
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from urllib.parse import urljoin
 
 from config.config import SERIES_INDEX_FILE, DATA_DIR
+from src.prompts import ask
 
 logger = logging.getLogger(__name__)
 
+# Base for resolving relative series links stored in the index
+SITE_URL = 'https://bs.to'
+
+# Indexes larger than this are parsed one series line at a time instead of in one read
+INDEX_STREAM_THRESHOLD = 5 * 1024 * 1024
+
 
 def _create_file_backup(filepath):
     """Create a backup of a file (up to 3 generations kept)."""
@@ -47,11 +60,24 @@ def _create_file_backup(filepath):
         logger.warning(f"Could not create backup of {filepath}: {e}")
 
 
+def _encode_json_array(items):
+    """Encode a list as a JSON array with one compact element per line.
+
+    json.dumps(indent=...) always runs the pure-Python encoder; encoding each
+    element compactly goes through the C encoder (~5x faster on a large index)
+    and still keeps one series per line, so diffs of the file stay readable.
+    """
+    if not items:
+        return "[]\n"
+    return "[\n" + ",\n".join("  " + json.dumps(item, ensure_ascii=False) for item in items) + "\n]\n"
+
+
 def _atomic_write_json(filepath, data):
     """Write JSON to file atomically via temp file + os.replace.
     
     Creates backup before writing to prevent data loss on corruption.
     Prevents corrupted files if the process is killed mid-write.
+    Lists are written one element per line (see _encode_json_array).
     """
     dirpath = os.path.dirname(filepath)
     os.makedirs(dirpath, exist_ok=True)
@@ -60,10 +86,19 @@ def _atomic_write_json(filepath, data):
     if os.path.exists(filepath):
         _create_file_backup(filepath)
     
+    # Encode fully before touching the temp file, then write the bytes in one call
+    if isinstance(data, list):
+        text = _encode_json_array(data)
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    payload = text.encode('utf-8')
+    
     fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix='.tmp')
     try:
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())  # data must be on disk before the rename makes it the index
         os.replace(tmp_path, filepath)
     except Exception:
         try:
@@ -72,7 +107,8 @@ def _atomic_write_json(filepath, data):
             pass
         raise
 
-_SEASON_NUMBER_RE = re.compile(r'(staffel|season|s)\s*(\d+)', re.IGNORECASE)
+# Season number from labels like 'Staffel 2' / 'Season 2' / 'S2' (prefix is non-capturing)
+_SEASON_NUMBER_RE = re.compile(r'(?:staffel|season|s)\s*(\d+)', re.IGNORECASE)
 
 
 def _validate_series_entry(series, title=''):
@@ -98,24 +134,60 @@ def _validate_series_entry(series, title=''):
     return True
 
 
-def _find_series(new_data, title):
-    """Look up a series by title in either a dict or list."""
-    if isinstance(new_data, dict):
-        return new_data.get(title)
-    if isinstance(new_data, list):
-        return next((s for s in new_data if s.get('title') == title), None)
-    return None
+def _absolute_url(url):
+    """Resolve a stored series link against the site root (absolute URLs pass through)."""
+    return urljoin(SITE_URL, url)
+
 
+def _intern_season_labels(series):
+    """Intern season labels in place.
 
-def _get_season_stats(series, season_label):
-    """Get (total_episodes, watched_episodes) for a specific season."""
+    json already shares repeated object keys within one document, but values
+    like 'Staffel 1' are allocated per occurrence; interning collapses them
+    to one object and makes label comparisons a pointer check.
+    """
+    for season in series.get('seasons') or []:
+        if isinstance(season, dict) and isinstance(season.get('season'), str):
+            season['season'] = sys.intern(season['season'])
+
+
+def _as_title_dict(data, rekey_dict=False):
+    """Return data as {title: series}; lists are keyed once, anything else is {}.
+
+    Dicts pass through unchanged. With rekey_dict=True (data read from disk), a dict
+    whose values are keyed by something other than title is re-keyed by title.
+    """
+    if isinstance(data, dict):
+        if not rekey_dict:
+            return data
+        first_item = next(iter(data.values()), None)
+        if first_item and isinstance(first_item, dict) and first_item.get('title'):
+            return data
+        data = data.values()
+    elif not isinstance(data, list):
+        return {}
+    return {item.get('title'): item for item in data if isinstance(item, dict) and item.get('title')}
+
+
+def _season_stats_by_label(series):
+    """Map season label -> (total_episodes, watched_episodes) for one series.
+
+    Built once per series so grouped displays don't rescan the season list for
+    every (title, season) group. If a label repeats, the first season wins.
+    """
+    stats = {}
     if not series:
-        return 0, 0
+        return stats
     for s in series.get('seasons', []):
-        if s.get('season') == season_label:
-            eps = s.get('episodes', [])
-            return len(eps), sum(1 for ep in eps if ep.get('watched', False))
-    return 0, 0
+        label = s.get('season')
+        if label not in stats:
+            total = watched = 0
+            for ep in s.get('episodes', ()):
+                total += 1
+                if ep.get('watched', False):
+                    watched += 1
+            stats[label] = (total, watched)
+    return stats
 
 
 def get_episode_counts(series):
@@ -123,9 +195,10 @@ def get_episode_counts(series):
     total = 0
     watched = 0
     for season in series.get('seasons', []):
-        eps = season.get('episodes', [])
-        total += len(eps)
-        watched += sum(1 for ep in eps if ep.get('watched', False))
+        for ep in season.get('episodes', ()):
+            total += 1
+            if ep.get('watched', False):
+                watched += 1
     return total, watched
 
 
@@ -151,60 +224,78 @@ def _order_series_entry(series):
     return ordered
 
 
-def paginate_list(items, formatter, page_size=50):
-    """Print items with pagination; Enter = next page, q = skip."""
+def paginate_list(items, formatter, page_size=50, out=None):
+    """Print items with pagination; Enter = next page, q = skip.
+
+    When stdin or stdout is not a terminal and BS_PAGINATE is unset, everything is written
+    at once. On a terminal taller than page_size, a page fills the screen.
+    out is an optional list of lines the caller has queued; they go out with the first page.
+    """
     if not items:
         return
+    pending = out or ()
+    if 'BS_PAGINATE' not in os.environ and not (sys.stdin.isatty() and sys.stdout.isatty()):
+        print('\n'.join(chain(pending, (formatter(item) for item in items))))
+        if out:
+            out.clear()
+        return
+    page_size = max(page_size, shutil.get_terminal_size().lines - 2)  # leave room for the prompt
     total = len(items)
+    remaining = iter(items)  # pages are pulled off one iterator — no per-page slice copies
     idx = 0
     while idx < total:
-        end = min(idx + page_size, total)
-        for item in items[idx:end]:
-            print(formatter(item))
-        idx = end
+        # One write per page instead of one print() per line
+        print('\n'.join(chain(pending, (formatter(item) for item in islice(remaining, page_size)))))
+        if out:
+            out.clear()
+        pending = ()
+        idx = min(idx + page_size, total)
         if idx < total:
-            choice = input(f"  ({idx}/{total}) Enter = more, q = skip: ").strip().lower()
+            choice = ask(f"  ({idx}/{total}) Enter = more, q = skip: ", 'BS_PAGINATE').strip().lower()
             if choice == 'q':
                 print(f"  ... skipped {total - idx} remaining")
                 break
 
 
+@lru_cache(maxsize=1024)
+def _season_number(label):
+    """Season number in a label ('Staffel 2' -> '2'), or None; an index has only a few dozen distinct labels."""
+    match = _SEASON_NUMBER_RE.search(label)
+    return match.group(1) if match else None
+
+
 def format_season_ep(season_label, ep_num):
     """Format season/episode for display (e.g. S1E5, [Specials] Ep 3)."""
-    match = _SEASON_NUMBER_RE.search(str(season_label))
-    if match:
-        return f"S{match.group(2)}E{ep_num}"
-    if str(season_label).strip().isdigit():
+    label = str(season_label)
+    number = _season_number(label)
+    if number is not None:
+        return f"S{number}E{ep_num}"
+    if label.strip().isdigit():
         return f"S{season_label}E{ep_num}"
     return f"[{season_label}] Ep {ep_num}"
 
 
-def group_episodes_by_season(episode_list, new_data, prefix='[+]'):
-    """Group (title, season, ep_num) tuples by season and format for display."""
-    
-    # Group by (title, season)
-    grouped = defaultdict(list)
-    
-    for item in episode_list:
-        title, season, ep_num = item[0], item[1], item[2]
-        grouped[(title, season)].append(ep_num)
-    
-    # Convert to dict for new_data lookup
-    if isinstance(new_data, list):
-        new_data_dict = {s.get('title'): s for s in new_data}
-    elif isinstance(new_data, dict):
-        new_data_dict = new_data
-    else:
-        new_data_dict = {}
+def group_episodes_by_season(episode_list, new_data, prefix='[+]', season_stats=None):
+    """Group (title, season, ep_num) tuples by season and format for display.
+
+    season_stats is an optional {title: {season label: (total, watched)}} cache shared between calls.
+    """
+    new_data_dict = _as_title_dict(new_data)
     
     result = []
-    for (title, season), ep_nums in sorted(grouped.items()):
-        series = new_data_dict.get(title, {})
-        total_in_season, watched_in_season = _get_season_stats(series, season)
+    if season_stats is None:
+        season_stats = {}  # title -> {season label: (total, watched)}, built on first use
+    # Sort by (title, season) and group adjacent runs; the episode numbers of a group
+    # are only materialized when there are no season stats to summarize them with
+    by_season = itemgetter(0, 1)
+    for (title, season), group in groupby(sorted(episode_list, key=by_season), key=by_season):
+        if title not in season_stats:
+            season_stats[title] = _season_stats_by_label(new_data_dict.get(title))
+        total_in_season, watched_in_season = season_stats[title].get(season, (0, 0))
         if total_in_season > 0:
             result.append(f"  {prefix} {title} [{season}]: {watched_in_season}/{total_in_season} episodes")
         else:
-            for ep_num in sorted(ep_nums):
+            for ep_num in sorted(item[2] for item in group):
                 result.append(f"  {prefix} {title} {format_season_ep(season, ep_num)}")
     
     return result
@@ -260,29 +351,43 @@ def show_vanished_series(old_data, all_discovered_slugs, scrape_scope):
             vanished.append(title)
 
     if corrupt_entries:
-        print(f"\n\u26a0 {len(corrupt_entries)} index entry(s) have corrupt/missing URL data:")
-        for t in corrupt_entries[:10]:
-            print(f"  \u2022 {t}")
+        lines = [f"\n\u26a0 {len(corrupt_entries)} index entry(s) have corrupt/missing URL data:"]
+        lines.extend(f"  \u2022 {t}" for t in corrupt_entries[:10])
         if len(corrupt_entries) > 10:
-            print(f"  ... and {len(corrupt_entries) - 10} more")
-        print("  These entries were skipped during vanished-series detection.")
+            lines.append(f"  ... and {len(corrupt_entries) - 10} more")
+        lines.append("  These entries were skipped during vanished-series detection.")
+        print('\n'.join(lines))
         logger.warning(f"Corrupt URL data in {len(corrupt_entries)} index entries: {corrupt_entries[:5]}")
 
     if vanished:
-        print(f"\n{'\u2500'*70}")
-        print(f"  [INFO] {len(vanished)} previously indexed series NOT found in current scrape:")
-        print(f"{'\u2500'*70}")
-        for title in vanished[:20]:
-            print(f"  \u2022 {title}  (not found on bs.to)")
+        rule = '\u2500' * 70  # built outside the f-strings: backslashes in f-string expressions need 3.12+
+        lines = [
+            f"\n{rule}",
+            f"  [INFO] {len(vanished)} previously indexed series NOT found in current scrape:",
+            rule,
+        ]
+        lines.extend(f"  \u2022 {title}  (not found on bs.to)" for title in vanished[:20])
         if len(vanished) > 20:
-            print(f"  ... and {len(vanished) - 20} more")
-        print(f"{'\u2500'*70}")
-        print("  These series are preserved unchanged in the index.")
+            lines.append(f"  ... and {len(vanished) - 20} more")
+        lines.append(rule)
+        lines.append("  These series are preserved unchanged in the index.")
+        print('\n'.join(lines))
         logger.info(f"Vanished series notification: {len(vanished)} series not found in scrape scope '{scrape_scope}'")
 
     return vanished
 
 
+def _episode_watch_map(series):
+    """Map (season label, str(episode number)) -> watched for every numbered episode of a series."""
+    return {
+        (season.get('season', ''), str(ep.get('number'))): bool(ep.get('watched', False))
+        for season in series.get('seasons', [])
+        if season and isinstance(season, dict)
+        for ep in season.get('episodes', [])
+        if ep and isinstance(ep, dict) and ep.get('number') is not None  # 0 is a valid number
+    }
+
+
 def detect_changes(old_data, new_data):
     """Detect changes between old and new data. Returns dict of change lists.
 
@@ -297,28 +402,21 @@ def detect_changes(old_data, new_data):
         "newly_unwatched": []     # watched → unwatched (needs separate confirmation)
     }
     
-    # Handle empty or invalid data
-    if not old_data:
-        old_data = []
-    if not new_data:
-        new_data = []
-    
-    old_titles = set(old_data.keys()) if isinstance(old_data, dict) else {s.get('title') for s in (old_data or []) if s and s.get('title')}
-    new_titles = set(new_data.keys()) if isinstance(new_data, dict) else {s.get('title') for s in (new_data or []) if s and s.get('title')}
-    
-    # Convert to dicts if needed
-    if isinstance(old_data, list):
-        old_data = {s.get('title'): s for s in (old_data or []) if s and s.get('title')}
-    if isinstance(new_data, list):
-        new_data = {s.get('title'): s for s in (new_data or []) if s and s.get('title')}
+    # Same object on both sides (no scrape happened): nothing can differ
+    if old_data is new_data:
+        return changes
+
+    # Convert to dicts if needed; the key views below do the set algebra without copying
+    old_data = _as_title_dict(old_data)
+    new_data = _as_title_dict(new_data)
     
     # New series (in scraped data but not in existing index)
-    for title in new_titles - old_titles:
+    for title in new_data.keys() - old_data.keys():
         if title:  # Skip None titles
             changes["new_series"].append(title)
     
     # Episode changes for existing series
-    for title in old_titles & new_titles:
+    for title in old_data.keys() & new_data.keys():
         try:
             old_series = old_data.get(title, {})
             new_series = new_data.get(title, {})
@@ -327,19 +425,14 @@ def detect_changes(old_data, new_data):
                 continue
             if not new_series or not isinstance(new_series, dict):
                 continue
+            if new_series is old_series:  # same entry object — cannot differ
+                continue
             
-            # Build map of (season, ep_number) -> watched status for old data
-            old_eps = {}
-            for season in old_series.get('seasons', []):
-                if not season or not isinstance(season, dict):
-                    continue
-                s_label = season.get('season', '')
-                for ep in season.get('episodes', []):
-                    if not ep or not isinstance(ep, dict):
-                        continue
-                    ep_num = ep.get('number')
-                    if ep_num is not None:  # Allow 0 as valid episode number
-                        old_eps[(s_label, str(ep_num))] = bool(ep.get('watched', False))
+            old_eps = _episode_watch_map(old_series)
+            # Fast path: every (episode, watched) pair already in the index —
+            # one C-level set comparison instead of walking the episodes
+            if _episode_watch_map(new_series).items() <= old_eps.items():
+                continue
             
             # Check new episodes and watch status changes
             for season in new_series.get('seasons', []):
@@ -384,54 +477,95 @@ def show_changes(changes, include_unwatched=True, include_watched=True, new_data
     if total == 0:
         return 0
 
-    print("\n" + "="*70)
-    print("  CHANGES DETECTED")
-    print("="*70)
+    # Index list input once so each section's lookups are dict hits, and share one
+    # {title: {season label: (total, watched)}} cache across the grouped sections
+    new_data = _as_title_dict(new_data)
+    season_stats = {}
+
+    # Headings are queued in out and written together with the next page of items
+    out = ["\n" + "="*70, "  CHANGES DETECTED", "="*70]
 
     if changes["new_series"]:
-        print(f"\n[NEW SERIES] ({len(changes['new_series'])})")
+        out.append(f"\n[NEW SERIES] ({len(changes['new_series'])})")
         def format_new_series(title):
-            if not new_data:
-                return f"  + {title}"
-            series = _find_series(new_data, title)
+            series = new_data.get(title)
             if not series:
                 return f"  + {title}"
             watched = series.get('watched_episodes', 0)
             total = series.get('total_episodes', 0)
             return f"  + {title}: {watched}/{total} watched"
-        paginate_list(changes["new_series"], format_new_series)
+        paginate_list(changes["new_series"], format_new_series, out=out)
 
     if changes["new_episodes"]:
         if new_data:
-            grouped_lines = group_episodes_by_season([(x[0], x[1], x[2]) for x in changes["new_episodes"]], new_data)
-            print(f"\n[NEW EPISODES] ({len(changes['new_episodes'])})")
-            paginate_list(grouped_lines, lambda line: line)
+            grouped_lines = group_episodes_by_season(changes["new_episodes"], new_data, season_stats=season_stats)
+            out.append(f"\n[NEW EPISODES] ({len(changes['new_episodes'])})")
+            paginate_list(grouped_lines, lambda line: line, out=out)
         else:
-            print(f"\n[NEW EPISODES] ({len(changes['new_episodes'])}) [ungrouped fallback]")
-            paginate_list(changes["new_episodes"], lambda x: f"  + {x[0]} [{x[1]}] Ep {x[2]}")
+            out.append(f"\n[NEW EPISODES] ({len(changes['new_episodes'])}) [ungrouped fallback]")
+            paginate_list(changes["new_episodes"], lambda x: f"  + {x[0]} [{x[1]}] Ep {x[2]}", out=out)
 
     if changes["newly_watched"] and include_watched:
-        print(f"\n[NEWLY WATCHED] ({len(changes['newly_watched'])} episodes)")
-        watched_lines = group_episodes_by_season(changes["newly_watched"], new_data)
-        paginate_list(watched_lines, lambda line: line)
+        out.append(f"\n[NEWLY WATCHED] ({len(changes['newly_watched'])} episodes)")
+        watched_lines = group_episodes_by_season(changes["newly_watched"], new_data, season_stats=season_stats)
+        paginate_list(watched_lines, lambda line: line, out=out)
 
     if changes.get("newly_unwatched") and include_unwatched:
-        print(f"\n[SITE REPORTS UNWATCHED] ({len(changes['newly_unwatched'])} episodes)")
-        unwatched_lines = group_episodes_by_season(changes["newly_unwatched"], new_data, prefix='[!]')
-        paginate_list(unwatched_lines, lambda line: line)
+        out.append(f"\n[SITE REPORTS UNWATCHED] ({len(changes['newly_unwatched'])} episodes)")
+        unwatched_lines = group_episodes_by_season(
+            changes["newly_unwatched"], new_data, prefix='[!]', season_stats=season_stats)
+        paginate_list(unwatched_lines, lambda line: line, out=out)
     
-    print("\n" + "="*70)
+    out.append("\n" + "="*70)
+    print('\n'.join(out))
     return total
 
 
+def _read_index_file():
+    """Parse SERIES_INDEX_FILE from one binary read (json.loads decodes UTF-8 bytes itself).
+
+    The read is sized from fstat so the buffer is allocated once; an empty file is an empty index.
+    """
+    with open(SERIES_INDEX_FILE, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        if size > INDEX_STREAM_THRESHOLD:
+            series = _parse_index_lines(f)
+            if series is not None:
+                return series
+            f.seek(0)
+        return json.loads(f.read(size))
+
+
+def _parse_index_lines(f):
+    """Parse the one-series-per-line layout written by _encode_json_array.
+
+    Only one line's bytes are held at a time, so a large index never sits in memory
+    as raw text and parsed objects together. Returns None if the file has any other
+    layout (e.g. an older indent=2 index); the caller then falls back to a full parse.
+    """
+    if f.readline().strip() != b'[':
+        return None
+    series = []
+    for line in f:
+        line = line.strip()
+        if line == b']':
+            return series
+        try:
+            series.append(json.loads(line[:-1] if line.endswith(b',') else line))
+        except json.JSONDecodeError:
+            return None
+    return None
+
+
 def _load_existing_index():
     """Load the current series index from disk (list or empty list)."""
     if not os.path.exists(SERIES_INDEX_FILE):
         logger.info(f"No existing index found at {SERIES_INDEX_FILE}")
         return []
     try:
-        with open(SERIES_INDEX_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_index_file()
         if not isinstance(data, (list, dict)):
             print("\u26a0 Index file is not a valid list or dict, ignoring.")
             logger.error("Index file is not a valid list or dict.")
@@ -452,6 +586,25 @@ def _load_existing_index():
         return []
 
 
+def _print_season_groups(items, new_dict, marker):
+    """Print one line per (title, season) in items with that season's watched/total counts."""
+    grouped = defaultdict(list)
+    for x in items:
+        grouped[(x[0], x[1])].append(x[2])
+    season_stats = {}  # title -> {season label: (total, watched)}, built on first use
+    lines = ["\n" + "-"*70]
+    for (title, season), ep_nums in grouped.items():
+        if title not in season_stats:
+            season_stats[title] = _season_stats_by_label(new_dict.get(title))
+        total_in_season, watched_in_season = season_stats[title].get(season, (0, 0))
+        if total_in_season > 0:
+            lines.append(f"  {marker} {title} [{season}]: {watched_in_season}/{total_in_season} episodes")
+        else:
+            lines.append(f"  {marker} {title} [{season}]: {len(ep_nums)} episode(s)")
+    lines.append("-"*70)
+    print('\n'.join(lines))
+
+
 def _prompt_watch_status_changes(changes, new_dict):
     """Prompt user to confirm watched/unwatched flips. Returns (allow_watched, allow_unwatched)."""
     allow_watched = False
@@ -461,19 +614,8 @@ def _prompt_watch_status_changes(changes, new_dict):
         logger.info(f"Prompting user to confirm marking {len(changes['newly_watched'])} episodes as watched.")
         print(f"\n[OK] {len(changes['newly_watched'])} episode(s) would change from UNWATCHED to WATCHED")
         print("   (manual confirmation required for all watched changes)")
-        print("\n" + "-"*70)
-        grouped = defaultdict(list)
-        for x in changes["newly_watched"]:
-            grouped[(x[0], x[1])].append(x[2])
-        for (title, season), ep_nums in grouped.items():
-            series = new_dict.get(title)
-            total_in_season, watched_in_season = _get_season_stats(series, season)
-            if total_in_season > 0:
-                print(f"  [+] {title} [{season}]: {watched_in_season}/{total_in_season} episodes")
-            else:
-                print(f"  [+] {title} [{season}]: {len(ep_nums)} episode(s)")
-        print("-"*70)
-        if input("\nAllow these episodes to be marked as WATCHED? (y/n): ").strip().lower() == 'y':
+        _print_season_groups(changes["newly_watched"], new_dict, '[+]')
+        if ask("\nAllow these episodes to be marked as WATCHED? (y/n): ", 'BS_ALLOW_WATCHED').strip().lower() == 'y':
             allow_watched = True
             logger.info("User allowed watched changes.")
         else:
@@ -484,19 +626,8 @@ def _prompt_watch_status_changes(changes, new_dict):
         logger.info(f"Prompting user to confirm marking {len(changes['newly_unwatched'])} episodes as unwatched.")
         print(f"\n[WARN] {len(changes['newly_unwatched'])} episode(s) would change from WATCHED to UNWATCHED")
         print("   (manual confirmation required for all unwatched changes)")
-        print("\n" + "-"*70)
-        grouped = defaultdict(list)
-        for x in changes["newly_unwatched"]:
-            grouped[(x[0], x[1])].append(x[2])
-        for (title, season), ep_nums in grouped.items():
-            series = new_dict.get(title)
-            total_in_season, watched_in_season = _get_season_stats(series, season)
-            if total_in_season > 0:
-                print(f"  [!] {title} [{season}]: {watched_in_season}/{total_in_season} episodes")
-            else:
-                print(f"  [!] {title} [{season}]: {len(ep_nums)} episode(s)")
-        print("-"*70)
-        if input("\nAllow these episodes to be marked as UNWATCHED? (y/n): ").strip().lower() == 'y':
+        _print_season_groups(changes["newly_unwatched"], new_dict, '[!]')
+        if ask("\nAllow these episodes to be marked as UNWATCHED? (y/n): ", 'BS_ALLOW_UNWATCHED').strip().lower() == 'y':
             allow_unwatched = True
             logger.info("User allowed unwatched changes.")
         else:
@@ -506,6 +637,38 @@ def _prompt_watch_status_changes(changes, new_dict):
     return allow_watched, allow_unwatched
 
 
+def _merge_seasons(old_entry, new_entry, allow_watched, allow_unwatched):
+    """Merge new_entry's seasons/episodes into old_entry, applying only the allowed watch flips."""
+    # Mutate the existing season/episode lists in place; only new items are appended
+    seasons = old_entry.setdefault('seasons', [])
+    old_seasons = {s.get('season'): s for s in seasons}
+
+    for new_season in new_entry.get('seasons', []):
+        season_label = new_season.get('season')
+        if season_label in old_seasons:
+            episodes = old_seasons[season_label].setdefault('episodes', [])
+            old_eps = {str(ep.get('number')): i for i, ep in enumerate(episodes)}
+            for new_ep in new_season.get('episodes', []):
+                ep_num = str(new_ep.get('number'))
+                i = old_eps.get(ep_num)
+                if i is None:
+                    old_eps[ep_num] = len(episodes)
+                    episodes.append(new_ep)
+                    continue
+                old_watched = episodes[i].get('watched', False)
+                new_watched = new_ep.get('watched', False)
+                if allow_watched and (not old_watched and new_watched):
+                    new_ep['watched'] = True
+                elif allow_unwatched and (old_watched and not new_watched):
+                    new_ep['watched'] = False
+                else:
+                    new_ep['watched'] = old_watched
+                episodes[i] = new_ep
+        else:
+            old_seasons[season_label] = new_season
+            seasons.append(new_season)
+
+
 def _merge_series_data(old_data, new_dict, allow_watched, allow_unwatched):
     """Merge new scraped data into the existing index.
 
@@ -513,48 +676,28 @@ def _merge_series_data(old_data, new_dict, allow_watched, allow_unwatched):
     flips when the corresponding flag is True.
     Returns merged dict {title: series}.
     """
-    if isinstance(old_data, list):
-        merged = {s.get('title'): s for s in old_data}
-    else:
-        merged = dict(old_data)
+    merged = dict(_as_title_dict(old_data))
 
+    now_iso = datetime.now().isoformat()  # one timestamp for the whole merge
     for title, new_entry in new_dict.items():
         if title not in merged:
-            new_entry['added_date'] = datetime.now().isoformat()
+            new_entry['added_date'] = now_iso
             merged[title] = _order_series_entry(new_entry)
             continue
 
         old_entry = merged[title]
-        old_seasons = {s.get('season'): s for s in old_entry.get('seasons', [])}
-
-        for new_season in new_entry.get('seasons', []):
-            season_label = new_season.get('season')
-            if season_label in old_seasons:
-                old_eps = {str(ep.get('number')): ep for ep in old_seasons[season_label].get('episodes', [])}
-                for new_ep in new_season.get('episodes', []):
-                    ep_num = str(new_ep.get('number'))
-                    if ep_num in old_eps:
-                        old_watched = old_eps[ep_num].get('watched', False)
-                        new_watched = new_ep.get('watched', False)
-                        if allow_watched and (not old_watched and new_watched):
-                            new_ep['watched'] = True
-                        elif allow_unwatched and (old_watched and not new_watched):
-                            new_ep['watched'] = False
-                        else:
-                            new_ep['watched'] = old_watched
-                    old_eps[ep_num] = new_ep  # update existing or add new
-                old_seasons[season_label]['episodes'] = list(old_eps.values())
-            else:
-                old_seasons[season_label] = new_season
+        # Fast path: structurally identical seasons (every episode field, not just watched)
+        # make the season-by-season merge a no-op
+        if new_entry is not old_entry and new_entry.get('seasons') != old_entry.get('seasons'):
+            _merge_seasons(old_entry, new_entry, allow_watched, allow_unwatched)
 
-        old_entry['seasons'] = list(old_seasons.values())
-        old_entry['total_seasons'] = len(old_entry['seasons'])
+        old_entry['total_seasons'] = len(old_entry.setdefault('seasons', []))
         total_eps, watched_eps = get_episode_counts(old_entry)
         old_entry['watched_episodes'] = watched_eps
         old_entry['total_episodes'] = total_eps
         old_entry['unwatched_episodes'] = old_entry['total_episodes'] - old_entry['watched_episodes']
         old_entry['url'] = new_entry.get('url', old_entry.get('url'))
-        old_entry['last_updated'] = datetime.now().isoformat()
+        old_entry['last_updated'] = now_iso
         merged[title] = _order_series_entry(old_entry)
 
     return merged
@@ -562,12 +705,10 @@ def _merge_series_data(old_data, new_dict, allow_watched, allow_unwatched):
 
 def confirm_and_save_changes(new_data, description="data"):
     """Show changes, prompt for confirmation, merge, and save. Returns True if saved."""
-    old_data = _load_existing_index()
+    # Key the on-disk list by title once; detect_changes and the merge both reuse it
+    old_data = _as_title_dict(_load_existing_index(), rekey_dict=True)
 
-    if isinstance(new_data, list):
-        new_dict = {s.get('title'): s for s in new_data}
-    else:
-        new_dict = dict(new_data)
+    new_dict = _as_title_dict(new_data)
 
     changes = detect_changes(old_data, new_dict)
     logger.info(f"Detected changes: { {k: len(v) for k,v in changes.items()} }")
@@ -593,7 +734,7 @@ def confirm_and_save_changes(new_data, description="data"):
 
     show_changes(changes, include_unwatched=allow_unwatched, include_watched=allow_watched, new_data=new_dict)
 
-    if input(f"\nSave these changes? (y/n): ").strip().lower() != 'y':
+    if ask("\nSave these changes? (y/n): ", 'BS_SAVE_CHANGES').strip().lower() != 'y':
         print("\u2717 Changes discarded. Nothing saved.")
         logger.info("User discarded changes. Nothing saved.")
         return False
@@ -626,29 +767,23 @@ class IndexManager:
         Validates loaded data for consistency.
         """
         self.series_index = {}
+        self.__dict__.pop('title_to_url', None)
+        self.__dict__.pop('series_by_link', None)
+        self.__dict__.pop('_progress_rows', None)
         if not os.path.exists(SERIES_INDEX_FILE):
             logger.info(f"No existing index found at {SERIES_INDEX_FILE}")
             return
         try:
-            with open(SERIES_INDEX_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_index_file()
             
             # Handle both formats robustly
-            if isinstance(data, list):
-                self.series_index = {item.get("title"): item for item in data if item.get("title")}
-            elif isinstance(data, dict):
-                first_item = next(iter(data.values()), None)
-                if first_item and isinstance(first_item, dict) and first_item.get('title'):
-                    self.series_index = data
-                else:
-                    self.series_index = {item.get("title"): item for item in data.values() if isinstance(item, dict) and item.get("title")}
-            else:
-                self.series_index = {}
+            self.series_index = _as_title_dict(data, rekey_dict=True)
             
             # Validate each series entry has required structure
             validated = {}
             for title, series in self.series_index.items():
                 if _validate_series_entry(series, title):
+                    _intern_season_labels(series)
                     validated[title] = series
             self.series_index = validated
             
@@ -667,9 +802,38 @@ class IndexManager:
             logger.error(f"Error loading index: {str(e)}")
             self.series_index = {}
 
-    def get_statistics(self):
-        """Return detailed analytics about the series index."""
-        series_with_progress = self.get_series_with_progress()
+    @cached_property
+    def title_to_url(self):
+        """Map each indexed title to its absolute series URL (built once per load)."""
+        urls = {}
+        for title, series in self.series_index.items():
+            url = series.get('url') or series.get('link')
+            if url:
+                urls[title] = _absolute_url(url)
+        return urls
+
+    @cached_property
+    def series_by_link(self):
+        """Map each series' link and url to its index entry (built once per load)."""
+        by_link = {}
+        for series in self.series_index.values():
+            for key in ('link', 'url'):
+                value = series.get(key)
+                if value:
+                    by_link.setdefault(value, series)
+        return by_link
+
+    def get_by_link(self, link):
+        """Return the indexed series for a link or url, or None."""
+        return self.series_by_link.get(link) if link else None
+
+    def get_statistics(self, series_with_progress=None):
+        """Return detailed analytics about the series index.
+
+        Pass the result of get_series_with_progress() to avoid recomputing it.
+        """
+        if series_with_progress is None:
+            series_with_progress = self.get_series_with_progress()
         total = len(series_with_progress)
         
         if total == 0:
@@ -681,38 +845,53 @@ class IndexManager:
                 "empty_series": 0
             }
         
-        watched = sum(1 for s in series_with_progress if not s['is_incomplete'])
+        # Gather every count, sum and bucket in a single pass over the series
+        watched = 0
+        empty_count = 0
+        not_started_count = 0
+        completion_sum = 0.0
+        total_episodes = 0
+        watched_episodes = 0
+        ongoing_only = []
+        completion_ranges = {"0-25%": 0, "25-50%": 0, "50-75%": 0, "75-99%": 0, "100%": 0}
+        for s in series_with_progress:
+            p = s['completion']
+            completion_sum += p
+            total_episodes += s['total_episodes']
+            watched_episodes += s['watched_episodes']
+            if not s['is_incomplete']:
+                watched += 1
+            if s['empty']:
+                empty_count += 1
+            if s['watched_episodes'] == 0:
+                not_started_count += 1
+            if p < 25:
+                completion_ranges["0-25%"] += 1
+            elif p < 50:
+                completion_ranges["25-50%"] += 1
+            elif p < 75:
+                completion_ranges["50-75%"] += 1
+            elif p < 100:
+                completion_ranges["75-99%"] += 1
+            else:
+                completion_ranges["100%"] += 1
+            if 0 < p < 100:
+                ongoing_only.append(s)
         unwatched = total - watched
-        empty_count = len([s for s in self.series_index.values() if s.get('empty', False)])
-        
-        # Calculate completion percentages
-        completion_percentages = [s['completion'] for s in series_with_progress]
-        avg_completion = round(sum(completion_percentages) / total, 2)
-        
-        # Episode statistics
-        total_episodes = sum(s['total_episodes'] for s in series_with_progress)
-        watched_episodes = sum(s['watched_episodes'] for s in series_with_progress)
-        avg_episodes_per_series = round(total_episodes / total, 1) if total > 0 else 0
-        
-        # Completion distribution
-        completion_ranges = {
-            "0-25%": sum(1 for p in completion_percentages if 0 <= p < 25),
-            "25-50%": sum(1 for p in completion_percentages if 25 <= p < 50),
-            "50-75%": sum(1 for p in completion_percentages if 50 <= p < 75),
-            "75-99%": sum(1 for p in completion_percentages if 75 <= p < 100),
-            "100%": sum(1 for p in completion_percentages if p == 100)
-        }
+        avg_completion = round(completion_sum / total, 2)
+        avg_episodes_per_series = round(total_episodes / total, 1)
         
         # Only consider ongoing series (started but not 100%) for most/least completed
-        ongoing_only = [s for s in series_with_progress if 0 < s['completion'] < 100]
-        sorted_ongoing = sorted(ongoing_only, key=lambda x: x['completion'], reverse=True)
-        most_completed = sorted_ongoing[:5]
-        least_completed = sorted_ongoing[-5:] if sorted_ongoing else []
+        # Only the top/bottom 5 are needed, so select them with heaps instead of a full sort
+        by_completion = itemgetter('completion')
+        most_completed = heapq.nlargest(5, ongoing_only, key=by_completion)
+        # nsmallest over the reversed list, flipped back, equals the old sorted(..., reverse=True)[-5:]
+        # exactly — including which of several tied series are picked and their order
+        least_completed = heapq.nsmallest(5, reversed(ongoing_only), key=by_completion)[::-1]
 
         # Series status counts
         completed_count = watched
         ongoing_count = len(ongoing_only)
-        not_started_count = sum(1 for s in series_with_progress if s['watched_episodes'] == 0)
         
         return {
             # Basic counts
@@ -753,35 +932,45 @@ class IndexManager:
     def get_full_report(self):
         """Generate a comprehensive report with categories and insights."""
         series_progress = self.get_series_with_progress()
-        stats = self.get_statistics()
+        stats = self.get_statistics(series_progress)
         
-        # Categorize series
-        watched_series = [s for s in series_progress if not s['is_incomplete']]
-        ongoing_series = [s for s in series_progress if s['is_incomplete'] and s['watched_episodes'] > 0]
-        not_started_series = [s for s in series_progress if s['is_incomplete'] and s['watched_episodes'] == 0]
+        # Categorize series (titles only, except ongoing) and bucket them by episode count in a single pass
+        watched_titles, ongoing_series, not_started_titles = [], [], []
+        short_series, medium_series, long_series = [], [], []
+        for s in series_progress:
+            if not s['is_incomplete']:
+                watched_titles.append(s['title'])
+            elif s['watched_episodes'] > 0:
+                ongoing_series.append(s)
+            else:
+                not_started_titles.append(s['title'])
+            if s['total_episodes'] <= 5:
+                short_series.append(s['title'])
+            elif s['total_episodes'] <= 25:
+                medium_series.append(s['title'])
+            else:
+                long_series.append(s['title'])
+        episode_ranges = {
+            "short_series": short_series,
+            "medium_series": medium_series,
+            "long_series": long_series
+        }
         
-        # Sort ongoing by completion % (descending)
-        ongoing_sorted = sorted(ongoing_series, key=lambda x: x['completion'], reverse=True)
+        # Sort ongoing by completion % (descending) — keyed on the dicts, titles projected after
+        ongoing_sorted = sorted(ongoing_series, key=itemgetter('completion'), reverse=True)
         ongoing_titles = [s['title'] for s in ongoing_sorted]
         
         # Sort not started alphabetically
-        not_started_titles = sorted([s['title'] for s in not_started_series])
-        
-        # Additional categories
-        # Series by episode count ranges
-        episode_ranges = {
-            "short_series": [s['title'] for s in series_progress if s['total_episodes'] <= 5],
-            "medium_series": [s['title'] for s in series_progress if 6 <= s['total_episodes'] <= 25],
-            "long_series": [s['title'] for s in series_progress if s['total_episodes'] > 25]
-        }
+        not_started_titles.sort()
         
         # Completion insights
         completion_insights = {
             "high_completion_threshold": 80,  # Series with >80% completion
-            "near_completion": [s['title'] for s in ongoing_sorted 
-                              if 80 <= s['completion'] < 100][:10],
-            "stalled_series": [s['title'] for s in ongoing_sorted 
-                             if s['completion'] < 25][:10]
+            # islice stops scanning once 10 matches are found
+            "near_completion": list(islice(
+                (s['title'] for s in ongoing_sorted if 80 <= s['completion'] < 100), 10)),
+            "stalled_series": list(islice(
+                (s['title'] for s in ongoing_sorted if s['completion'] < 25), 10))
         }
         
         report = {
@@ -793,8 +982,8 @@ class IndexManager:
             },
             "categories": {
                 "watched": {
-                    "count": len(watched_series),
-                    "titles": sorted([s['title'] for s in watched_series])
+                    "count": len(watched_titles),
+                    "titles": sorted(watched_titles)
                 },
                 "ongoing": {
                     "count": len(ongoing_series),
@@ -804,7 +993,7 @@ class IndexManager:
                               for s in ongoing_sorted[:20]]  # Top 20 ongoing
                 },
                 "not_started": {
-                    "count": len(not_started_series),
+                    "count": len(not_started_titles),
                     "titles": not_started_titles
                 }
             },
@@ -823,19 +1012,21 @@ class IndexManager:
         }
         return report
         
-    def get_series_with_progress(self, sort_by='completion', reverse=False):
-        """Return series list with episode progress and completion percentages."""
-        series_list = []
+    @cached_property
+    def _progress_rows(self):
+        """Per-series episode totals and completion, walked once per index load."""
+        rows = []
         for s in self.series_index.values():
             total_eps = 0
             watched_eps = 0
             for season in s.get('seasons', []):
-                eps = season.get('episodes', [])
-                total_eps += len(eps)
-                watched_eps += sum(1 for ep in eps if ep.get('watched', False))
+                for ep in season.get('episodes', ()):
+                    total_eps += 1
+                    if ep.get('watched', False):
+                        watched_eps += 1
             is_incomplete = (total_eps == 0) or (watched_eps < total_eps)
             completion = round((watched_eps / total_eps) * 100, 2) if total_eps > 0 else 0.0
-            series_list.append({
+            rows.append({
                 'title': s.get('title', ''),
                 'watched_episodes': watched_eps,
                 'total_episodes': total_eps,
@@ -843,6 +1034,14 @@ class IndexManager:
                 'completion': completion,
                 'empty': s.get('empty', False)
             })
+        return tuple(rows)
+
+    def get_series_with_progress(self, sort_by='completion', reverse=False):
+        """Return series list with episode progress and completion percentages.
+
+        The episode walk is cached per index load; each call gets its own sorted list.
+        """
+        series_list = list(self._progress_rows)
         if sort_by:
             series_list.sort(key=lambda x: x.get(sort_by, 0), reverse=reverse)
         return series_list
@@ -0,0 +1,27 @@
+"""
+Interactive prompts
+
+input() wrappers whose answers can be preset through environment variables,
+so menu actions can run unattended (scripts, cron).
+"""
+
+import os
+
+
+def ask(prompt, env_var=None):
+    """input() that can be answered ahead of time through an environment variable.
+
+    When env_var is set, its value is echoed and used instead of reading stdin,
+    so menu actions can run unattended (scripts, cron).
+    """
+    if env_var:
+        value = os.environ.get(env_var)
+        if value is not None:
+            print(f"{prompt}{value}  [{env_var}]")
+            return value
+    return input(prompt)
+
+
+def is_preset(env_var):
+    """True if env_var presets the answer — asking again would return the same value."""
+    return os.environ.get(env_var) is not None
@@ -39,10 +39,16 @@ logger = logging.getLogger(__name__)
 
 # Worker pool size — override via BS_MAX_WORKERS env var
 MAX_WORKERS = int(os.getenv("BS_MAX_WORKERS", "24"))
+# URL-list batches are small — cap their pool separately (BS_BATCH_WORKERS) to stay polite to bs.to
+BATCH_MAX_WORKERS = int(os.getenv("BS_BATCH_WORKERS", "5"))
 USE_PARALLEL = True
 
-# Checkpoint frequency (save progress every N series)
-CHECKPOINT_EVERY = 10
+# Cap on simultaneous page loads across all workers — BS_MAX_CONCURRENT_REQUESTS (0 = no cap)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("BS_MAX_CONCURRENT_REQUESTS", "8"))
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS) if MAX_CONCURRENT_REQUESTS > 0 else None
+
+# Checkpoint frequency (save progress every N series) — BS_CHECKPOINT_EVERY=1 saves after each one
+CHECKPOINT_EVERY = max(1, int(os.getenv("BS_CHECKPOINT_EVERY", "10")))
 
 # Max retries for worker authentication
 MAX_AUTH_RETRIES = 3
@@ -56,12 +62,28 @@ _DOMAIN_STRIP_RE = re.compile(r'^https?://[^/]+')
 _UTILITY_PAGES = {'alle serien', 'andere serien', 'beliebte serien', 'neue serien', 'empfehlung', 'meistgesehen'}
 _SERIE_PATH_RE = re.compile(r'(/serie/[^/]+)')
 
+# Progress bars are rendered once per scraped series — prebuild every fill level
+_BAR_LENGTH = 30
+_PROGRESS_BARS = tuple('█' * filled + '░' * (_BAR_LENGTH - filled) for filled in range(_BAR_LENGTH + 1))
+
 
 def is_regular_season(season_label):
     """True for numbered seasons (Staffel 1, Season 2, S3, etc.), False for specials."""
     return bool(_SEASON_LABEL_RE.search(season_label.strip()))
 
 
+def _progress_bar(done, total):
+    """Return the prebuilt progress bar string for done/total."""
+    filled = int(_BAR_LENGTH * done / total) if total else 0
+    return _PROGRESS_BARS[min(max(filled, 0), _BAR_LENGTH)]
+
+
+def _read_json(filepath):
+    """Read a JSON state file with a single binary read (json decodes UTF-8 bytes itself)."""
+    with open(filepath, 'rb') as f:
+        return json.loads(f.read())
+
+
 def _is_pid_alive(pid):
     """Check if a process with the given PID is still running."""
     try:
@@ -79,24 +101,52 @@ def _is_pid_alive(pid):
         return False
 
 
-def _kill_pids_in_file(pids_dict):
-    """Kill all geckodriver PIDs listed in a pids dict (skips _owner_pid)."""
-    for key, pid in pids_dict.items():
-        if key == '_owner_pid':
-            continue
+def kill_pids(pids):
+    """Force-kill geckodriver PIDs (with their child trees on Windows). Returns how many were killed.
+
+    Windows: one taskkill call with a /PID flag per process instead of one
+    taskkill spawn each. taskkill fails as a whole if any PID is already gone,
+    so liveness is sampled before the call and, on failure, again after it;
+    the count is the PIDs that were alive before and are gone after.
+    POSIX: os.kill() directly, no subprocess at all.
+    """
+    valid = []
+    for pid in pids:
         try:
-            if sys.platform == 'win32':
-                subprocess.run(
-                    ['taskkill', '/F', '/PID', str(pid), '/T'],
-                    capture_output=True, check=False
-                )
-            else:
-                subprocess.run(
-                    ['kill', '-9', str(pid)],
-                    capture_output=True, check=False
-                )
+            valid.append(int(pid))
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring invalid PID: {pid!r}")
+    if not valid:
+        return 0
+    if sys.platform == 'win32':
+        alive_before = [pid for pid in valid if _is_pid_alive(pid)]
+        if not alive_before:
+            return 0
+        cmd = ['taskkill', '/F', '/T']
+        for pid in alive_before:
+            cmd += ['/PID', str(pid)]
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=False)
+            if result.returncode == 0:
+                return len(alive_before)
+            logger.debug(f"taskkill reported a failure: {result.stderr!r}")
         except (OSError, subprocess.SubprocessError):
             pass
+        # Some PIDs exited on their own meanwhile (or taskkill failed) — count what actually went away
+        return sum(1 for pid in alive_before if not _is_pid_alive(pid))
+    killed = 0
+    for pid in valid:
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            pass
+    return killed
+
+
+def _kill_pids_in_file(pids_dict):
+    """Kill all geckodriver PIDs listed in a pids dict (skips _owner_pid)."""
+    kill_pids(pid for key, pid in pids_dict.items() if key != '_owner_pid')
 
 
 def cleanup_stale_worker_pids():
@@ -113,8 +163,7 @@ def cleanup_stale_worker_pids():
     for fname in files:
         fpath = os.path.join(DATA_DIR, fname)
         try:
-            with open(fpath, 'r') as f:
-                pids = json.load(f)
+            pids = _read_json(fpath)
             if not isinstance(pids, dict):
                 os.remove(fpath)
                 continue
@@ -136,8 +185,7 @@ def cleanup_geckodriver_processes():
     """Kill geckodriver processes we spawned (tracked by this process's own PID file)."""
     if os.path.exists(_MY_PID_FILE):
         try:
-            with open(_MY_PID_FILE, 'r') as f:
-                pids = json.load(f)
+            pids = _read_json(_MY_PID_FILE)
             if isinstance(pids, dict):
                 _kill_pids_in_file(pids)
         except (OSError, json.JSONDecodeError, ValueError):
@@ -189,6 +237,7 @@ class BsToScraper:
         self.series_data = []
         self.config = SELECTORS_CONFIG
         self.auth_cookies = []
+        self.session_file = os.path.join(DATA_DIR, '.session_cookies.json')
         self.checkpoint_file = os.path.join(DATA_DIR, '.scrape_checkpoint.json')
         self.failed_file = os.path.join(DATA_DIR, '.failed_series.json')
         self.pause_file = os.path.join(DATA_DIR, '.pause_scraping')
@@ -199,7 +248,9 @@ class BsToScraper:
         self._worker_lock = threading.Lock()
         self._checkpoint_mode = None
         self._use_parallel = USE_PARALLEL
-        self._season_max_retries = int(self.config.get('timing', {}).get('max_retries_season') or 0) or 3
+        # Configured per-season retry count; retry-failed mode raises _season_max_retries for its run only
+        self._default_season_max_retries = int(self.config.get('timing', {}).get('max_retries_season') or 0) or 3
+        self._season_max_retries = self._default_season_max_retries
         self._last_pause_check = 0.0
         self._pause_cached = False
         self.all_discovered_series = None
@@ -214,8 +265,7 @@ class BsToScraper:
     def _load_scrape_timing(self):
         """Load avg time per series from last completed scrape."""
         try:
-            with open(self.timing_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(self.timing_file)
             avg = data.get('avg_per_series')
             if avg and avg > 0:
                 return float(avg)
@@ -282,10 +332,13 @@ class BsToScraper:
         except Exception as e:
             logger.warning(f"Could not check disk space: {e}")
         
+        # json.dumps takes the C encoder; json.dump(f) always runs the pure-Python
+        # iterencode and issues a write per chunk — checkpoints carry every scraped series
+        text = json.dumps(data, ensure_ascii=False)
         fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix='.tmp')
         try:
             with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
+                f.write(text)
             os.replace(tmp_path, filepath)
         except Exception:
             try:
@@ -313,6 +366,14 @@ class BsToScraper:
     def get_site_url(self):
         return self.config.get('site_url', 'https://bs.to')
     
+    def _navigate(self, driver, url):
+        """driver.get() that waits for a free request slot, so workers don't all hit bs.to at once."""
+        if _REQUEST_SLOTS is None:
+            driver.get(url)
+            return
+        with _REQUEST_SLOTS:
+            driver.get(url)
+
     def _is_driver_alive(self, driver=None):
         """Check if a WebDriver session is still usable."""
         drv = driver or self.driver
@@ -402,17 +463,6 @@ class BsToScraper:
     
     # ==================== ELEMENT FINDING ====================
     
-    def convert_selector_to_by(self, selector_type):
-        by_map = {
-            'id': By.ID,
-            'name': By.NAME,
-            'css': By.CSS_SELECTOR,
-            'xpath': By.XPATH,
-            'tag': By.TAG_NAME,
-            'class': By.CLASS_NAME
-        }
-        return by_map.get(selector_type, By.CSS_SELECTOR)
-
     def get_timing_float(self, key, default, min_val=0.0, max_val=None):
         """Read a timing value from config as float (safe with None/invalid values).
         
@@ -459,29 +509,6 @@ class BsToScraper:
             logger.warning(f"Invalid timing value for {key}: {value}, using default {default}")
             return int(default) if default is not None else 0
     
-    def find_element_from_config(self, driver, config_selectors, timeout=None):
-        """Try each selector from config until one matches."""
-        if not isinstance(config_selectors, list):
-            config_selectors = [config_selectors]
-        if timeout is None:
-            timeout = self.get_timing_float('element_find_timeout', 2.0)
-        
-        for selector_config in config_selectors:
-            selector_type = selector_config.get('type', 'css')
-            selector_value = selector_config.get('value')
-            
-            by = self.convert_selector_to_by(selector_type)
-            
-            try:
-                element = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((by, selector_value))
-                )
-                return element
-            except Exception:
-                continue
-        
-        return None
-    
     def wait_for_element(self, driver, selector_by, selector_value, timeout=None, silent=False):
         """Wait for element to be present. Returns True on success, False on timeout."""
         if timeout is None:
@@ -548,11 +575,8 @@ class BsToScraper:
         Restores completed_links, mode, and series_data (if saved).
         """
         with self._worker_lock:
-            if not os.path.exists(self.checkpoint_file):
-                return False
             try:
-                with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _read_json(self.checkpoint_file)
                 if isinstance(data, dict) and 'completed_links' in data:
                     self.completed_links = set(data.get('completed_links', []))
                     self._checkpoint_mode = data.get('mode')
@@ -567,6 +591,8 @@ class BsToScraper:
                 else:
                     print(f"✗ Checkpoint file is invalid or corrupted.")
                     return False
+            except FileNotFoundError:
+                return False
             except Exception as e:
                 print(f"✗ Failed to load checkpoint: {e}")
                 return False
@@ -584,12 +610,11 @@ class BsToScraper:
     def get_checkpoint_mode(data_dir):
         """Read checkpoint mode without fully loading the scraper."""
         path = os.path.join(data_dir, '.scrape_checkpoint.json')
-        if not os.path.exists(path):
-            return None
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(path)
             return data.get('mode') if isinstance(data, dict) else None
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, OSError) as e:
             logger.debug(f"Could not read checkpoint mode: {e}")
             return None
@@ -625,8 +650,7 @@ class BsToScraper:
     def _load_failed_series_unlocked(self):
         """Internal: load failed series without locking (for use within locked context)."""
         try:
-            with open(self.failed_file, 'r', encoding='utf-8') as f:
-                return json.load(f) or []
+            return _read_json(self.failed_file) or []
         except FileNotFoundError:
             return []
         except json.JSONDecodeError as e:
@@ -683,14 +707,20 @@ class BsToScraper:
             except Exception as e:
                 logger.debug(f"Failed to save worker PID {worker_id}: {e}")
     
-    def clear_worker_pids(self):
+    def clear_worker_pids(self, keep_main=False):
+        """Forget tracked worker PIDs. With keep_main, the main driver (worker 0) stays tracked."""
         with self._worker_lock:
-            self.worker_pids = {}
+            main_pid = self.worker_pids.get('0') if keep_main else None
+            self.worker_pids = {'0': main_pid} if main_pid is not None else {}
             try:
-                if os.path.exists(self.worker_pids_file):
+                if self.worker_pids:
+                    payload = {'_owner_pid': os.getpid()}
+                    payload.update(self.worker_pids)
+                    self._atomic_write_json(self.worker_pids_file, payload)
+                elif os.path.exists(self.worker_pids_file):
                     os.remove(self.worker_pids_file)
             except OSError as e:
-                logger.debug(f"Could not remove worker PIDs file: {e}")
+                logger.debug(f"Could not update worker PIDs file: {e}")
     
     # ==================== DRIVER SETUP ====================
     
@@ -797,7 +827,20 @@ class BsToScraper:
                 self.driver.quit()
             except Exception:
                 pass
+            self.driver = None
             print("✓ Browser closed")
+
+    def reset(self):
+        """Clear per-run state so one scraper (and its browser) can serve several runs."""
+        self.series_data = []
+        self.completed_links = set()
+        self.failed_links = []
+        self.all_discovered_series = None
+        self._checkpoint_mode = None
+        self._last_pause_check = 0.0
+        self._pause_cached = False
+        self._season_max_retries = self._default_season_max_retries
+        self._historical_avg = None
     
     # ==================== AUTHENTICATION ====================
     
@@ -812,7 +855,7 @@ class BsToScraper:
             login_page = self.get_login_page()
             if drv is self.driver:
                 print(f"→ Navigating to login page: {login_page}")
-            drv.get(login_page)
+            self._navigate(drv, login_page)
             self._wait_for_page_ready(drv, timeout=self.get_timing_float('login_page_ready_timeout', 5.0))
             
             # Grab a reference to an element on the current page before submit
@@ -847,6 +890,7 @@ class BsToScraper:
                         self.auth_cookies = drv.get_cookies()
                     except Exception:
                         self.auth_cookies = []
+                    self._save_session()
                 return
 
             raise Exception(f"Login verification failed. URL: {drv.current_url}")
@@ -860,6 +904,39 @@ class BsToScraper:
                 print(f"✗ Login failed after {retry_count + 1} attempts: {str(e)}")
             raise
     
+    def _save_session(self):
+        """Persist main-driver auth cookies so the next run can skip the login form."""
+        if not self.auth_cookies:
+            return
+        try:
+            self._atomic_write_json(self.session_file, self.auth_cookies)
+        except Exception as e:
+            logger.warning(f"Failed to save session cookies: {e}")
+
+    def _restore_session(self):
+        """Reuse cookies from a previous run on the main driver. Returns True if still logged in."""
+        try:
+            cookies = _read_json(self.session_file)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable session file: {e}")
+            return False
+        if not isinstance(cookies, list) or not cookies:
+            return False
+        self.auth_cookies = cookies
+        if self._apply_cookies_to_driver(self.driver) and self.is_logged_in(self.driver):
+            print("✓ Restored saved session (login skipped)")
+            return True
+        logger.info("Saved session expired — logging in again")
+        self.auth_cookies = []
+        return False
+
+    def ensure_logged_in(self):
+        """Authenticate the main driver, preferring a saved session over a fresh login."""
+        if not self._restore_session():
+            self.login()
+
     # ==================== SERIES DISCOVERY ====================
     
     def get_all_series(self):
@@ -875,7 +952,7 @@ class BsToScraper:
             series_page = series_config.get('page_url', '/andere-serien')
             all_series_url = f"{site_url}{series_page}"
             
-            self.driver.get(all_series_url)
+            self._navigate(self.driver, all_series_url)
             self._wait_for_page_ready(self.driver)
             
             page_content = self.driver.page_source
@@ -1263,7 +1340,7 @@ class BsToScraper:
         Used by both sequential (self.driver) and parallel (worker) modes.
         """
         try:
-            driver.get(url)
+            self._navigate(driver, url)
             self._wait_for_page_ready(driver)
             self.wait_for_css_element(driver, "#seasons", timeout=self.get_timing_float('season_nav_timeout', 10.0), silent=True)
 
@@ -1343,7 +1420,7 @@ class BsToScraper:
                             logger.error(f"Driver died during season {season_label} retries — aborting series")
                             break
                         try:
-                            driver.get(season_url)
+                            self._navigate(driver, season_url)
                             # Wait for the season page to finish loading before parsing.
                             self._wait_for_page_ready(driver, timeout=self.get_timing_float('season_page_ready_timeout', 5.0))
                             # Use a fixed timeout for the episodes table.
@@ -1470,6 +1547,7 @@ class BsToScraper:
             return
         self._historical_avg = self._load_scrape_timing()
         start_time = time.time()
+        total = len(all_series)
         try:
             for idx, series in enumerate(all_series, 1):
                 # Check for pause request
@@ -1497,13 +1575,10 @@ class BsToScraper:
                 try:
                     # Calculate progress and ETA
                     elapsed = time.time() - start_time
-                    eta_mins = self._compute_eta_mins(idx - 1, len(all_series), elapsed, self._historical_avg)
-                    progress_pct = int((idx / len(all_series)) * 100)
-                    
-                    # Progress bar
-                    bar_length = 30
-                    filled = int(bar_length * idx / len(all_series))
-                    bar = '█' * filled + '░' * (bar_length - filled)
+                    eta_mins = self._compute_eta_mins(idx - 1, total, elapsed, self._historical_avg)
+                    progress_pct = int((idx / total) * 100)
+                    # Shared row prefix, built once per series
+                    prefix = f"[{idx}/{total}] [{_progress_bar(idx, total)}] {progress_pct}% | ETA: {eta_mins}m | Fallback | "
                     
                     result = self.process_series_page(series['url'], series_hint=series)
                     if result:
@@ -1512,10 +1587,10 @@ class BsToScraper:
                         # Mark empty series
                         if result['total_episodes'] == 0:
                             result['empty'] = True
-                            print(f"[{idx}/{len(all_series)}] [{bar}] {progress_pct}% | ETA: {eta_mins}m | Fallback | ⚠ {result['title']}{season_info}: No episodes")
+                            print(f"{prefix}⚠ {result['title']}{season_info}: No episodes")
                         else:
                             result['empty'] = False
-                            print(f"[{idx}/{len(all_series)}] [{bar}] {progress_pct}% | ETA: {eta_mins}m | Fallback | ✓ {result['title']}{season_info}: {result['watched_episodes']}/{result['total_episodes']} watched")
+                            print(f"{prefix}✓ {result['title']}{season_info}: {result['watched_episodes']}/{result['total_episodes']} watched")
                         self.series_data.append(result)
                         # Track series with parsing issues for rescrape
                         if result.get('_has_malformed_episodes'):
@@ -1525,7 +1600,7 @@ class BsToScraper:
                         if idx % CHECKPOINT_EVERY == 0:
                             self.save_checkpoint()
                     else:
-                        print(f"[{idx}/{len(all_series)}] [{bar}] {progress_pct}% | ETA: {eta_mins}m | Fallback | ⚠ {series['title']}: Skipped (no data)")
+                        print(f"{prefix}⚠ {series['title']}: Skipped (no data)")
                         self.failed_links.append(series)
                 except Exception as e:
                     print(f"  ⚠ Error processing {series['title']}: {str(e)}")
@@ -1555,8 +1630,12 @@ class BsToScraper:
         self._save_scrape_timing(total_time, len(all_series))
         print(f"\n✓ Completed in {total_mins}m {total_secs}s", flush=True)
     
-    def _scrape_series_parallel(self, all_series, worker_cap=None):
-        """Parallel scraping with shared work queue and per-worker Firefox instances."""
+    def _scrape_series_parallel(self, all_series, worker_cap=None, series_per_worker=15):
+        """Parallel scraping with shared work queue and per-worker Firefox instances.
+
+        Starts roughly one worker per series_per_worker queued series, capped at
+        worker_cap (default MAX_WORKERS).
+        """
         # Clear leftover pause file
         self.clear_pause_request()
         
@@ -1576,32 +1655,33 @@ class BsToScraper:
         total_series = len(filtered_series)
 
         max_workers_allowed = worker_cap if worker_cap is not None else MAX_WORKERS
-        # Scale workers: ~1 per 15 series, minimum 1, capped at max_workers_allowed
-        worker_count = min(max_workers_allowed, max(1, total_series // 15))
+        # Scale workers: ~1 per series_per_worker series, minimum 1, capped at max_workers_allowed
+        worker_count = min(max_workers_allowed, max(1, total_series // series_per_worker))
         
         # Shared work queue
         work_queue = queue.Queue()
         for item in filtered_series:
             work_queue.put(item)
         
-        print(f"→ {total_series} series queued for {worker_count} workers (shared work queue)")
+        slots_info = f", max {MAX_CONCURRENT_REQUESTS} concurrent page loads" if _REQUEST_SLOTS is not None else ""
+        print(f"→ {total_series} series queued for {worker_count} workers (shared work queue{slots_info})")
+
+        workers_label = f"Workers: {worker_count}"
 
         def progress_line(done, total, title, watched=None, episode_total=None, empty=False, error=None, worker_id=None, season_labels=None):
             elapsed = time.time() - start_time
             processed = done + failed
             eta_mins = self._compute_eta_mins(processed, total, elapsed, self._historical_avg)
             pct = int((processed / total) * 100)
-            bar_len = 30
-            filled = int(bar_len * processed / total)
-            bar = '█' * filled + '░' * (bar_len - filled)
-            worker_info = f" | W{worker_id}/{worker_count}" if worker_id else f" | Workers: {worker_count}"
+            worker_info = f"W{worker_id}/{worker_count}" if worker_id else workers_label
+            prefix = f"[{processed}/{total}] [{_progress_bar(processed, total)}] {pct}% | ETA: {eta_mins}m | {worker_info} | "
             season_info = f" [{','.join(season_labels)}]" if season_labels else ""
             if error:
-                print(f"[{done+failed}/{total}] [{bar}] {pct}% | ETA: {eta_mins}m{worker_info} | ✗ {title}: {error}")
+                print(f"{prefix}✗ {title}: {error}")
             elif empty:
-                print(f"[{done+failed}/{total}] [{bar}] {pct}% | ETA: {eta_mins}m{worker_info} | ⚠ {title}{season_info}: No episodes")
+                print(f"{prefix}⚠ {title}{season_info}: No episodes")
             else:
-                print(f"[{done+failed}/{total}] [{bar}] {pct}% | ETA: {eta_mins}m{worker_info} | ✓ {title}{season_info}: {watched}/{episode_total} watched")
+                print(f"{prefix}✓ {title}{season_info}: {watched}/{episode_total} watched")
 
         def worker_loop(worker_id):
             nonlocal completed, failed
@@ -1634,7 +1714,7 @@ class BsToScraper:
                     else:
                         # Cookie sharing failed, fall back to full login
                         self.login(driver)
-                        driver.get(self.get_site_url())
+                        self._navigate(driver, self.get_site_url())
                         time.sleep(auth_page_delay)
                         if self.is_logged_in(driver):
                             authenticated = True
@@ -1920,7 +2000,7 @@ class BsToScraper:
         if error_streak >= 3:
             try:
                 if not self.is_logged_in(driver):
-                    driver.get(self.get_site_url())
+                    self._navigate(driver, self.get_site_url())
                     if not self.is_logged_in(driver):
                         needs_reauth = True
             except Exception:
@@ -1986,7 +2066,7 @@ class BsToScraper:
         if not cookies_snapshot:
             return False
         try:
-            driver.get(self.get_site_url())
+            self._navigate(driver, self.get_site_url())
             self._wait_for_page_ready(driver, timeout=self.get_timing_float('cookie_apply_page_ready_timeout', 5.0))
             for cookie in cookies_snapshot:
                 try:
@@ -2017,7 +2097,8 @@ class BsToScraper:
         """
         try:
             if url.startswith('http'):
-                path = urlparse(url).path
+                # Plain string splits instead of urlparse() — this runs once per discovered series
+                path = url.partition('://')[2].partition('?')[0].partition('#')[0]
             else:
                 path = url
             parts = path.split('/')
@@ -2034,8 +2115,7 @@ class BsToScraper:
         existing = set()
         try:
             if os.path.exists(SERIES_INDEX_FILE):
-                with open(SERIES_INDEX_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _read_json(SERIES_INDEX_FILE)
                 if isinstance(data, list):
                     for item in data or []:
                         url = item.get('url', '') or item.get('link', '')
@@ -2111,14 +2191,20 @@ class BsToScraper:
         self.series_data = []
         if self._use_parallel and len(series_list) > 1:
             print(f"→ Scraping {len(urls)} series from URL list (parallel mode)...")
-            self._scrape_series_parallel(series_list)
+            # Batches are short, so spread them across a few browsers instead of 1 per 15 series
+            self._scrape_series_parallel(series_list, worker_cap=BATCH_MAX_WORKERS, series_per_worker=2)
         else:
             print(f"→ Scraping {len(urls)} series from URL list (sequential mode)...")
             self._scrape_series_sequential(series_list)
         print(f"  Successfully scraped: {len(self.series_data)}/{len(urls)} series")
     
-    def run(self, single_url=None, url_list=None, new_only=False, resume_only=False, retry_failed=False, parallel=None):
-        """Main entry point: setup driver, login, run selected mode, then close."""
+    def run(self, single_url=None, url_list=None, new_only=False, resume_only=False, retry_failed=False, parallel=None,
+            keep_browser=False):
+        """Main entry point: setup driver, login, run selected mode, then close.
+
+        With keep_browser=True the main browser stays open (and logged in) after the run,
+        and the next run() on this instance reuses it. Call close() when done.
+        """
         # Store parallel preference (thread-safe, no global mutation)
         if parallel is not None:
             self._use_parallel = parallel
@@ -2127,9 +2213,16 @@ class BsToScraper:
         else:
             self._use_parallel = USE_PARALLEL
         
+        self.reset()
         try:
-            self.setup_driver()
-            self.login()
+            if self._is_driver_alive():
+                print("→ Reusing open browser session")
+                if not self._has_auth_cookies(self.driver):
+                    self.ensure_logged_in()
+            else:
+                self.driver = None
+                self.setup_driver()
+                self.ensure_logged_in()
             
             if resume_only:
                 if self.load_checkpoint():
@@ -2176,5 +2269,8 @@ class BsToScraper:
                 self.save_failed_series()
             raise
         finally:
-            self.clear_worker_pids()
-            self.close()
+            if keep_browser and self._is_driver_alive():
+                self.clear_worker_pids(keep_main=True)
+            else:
+                self.clear_worker_pids()
+                self.close()